@@ -107,8 +107,7 @@ Format as: "AI Analysis: [your assessment]"
         cache_key = self._get_cache_key("risk", {"score": risk_score, "amount": amount, "context": context})
 
         # Check session cache
-        if 'ai_cache' not in st.session_state:
-            st.session_state.ai_cache = {}
+        st.session_state.setdefault('ai_cache', {})
 
         if cache_key in st.session_state.ai_cache:
             return st.session_state.ai_cache[cache_key]
@@ -144,8 +143,7 @@ Format as: "AI Analysis: [your recommendation]"
 
         cache_key = self._get_cache_key("threshold", {"threshold": current_threshold, **recent_stats})
 
-        if 'ai_cache' not in st.session_state:
-            st.session_state.ai_cache = {}
+        st.session_state.setdefault('ai_cache', {})
 
         if cache_key in st.session_state.ai_cache:
             return st.session_state.ai_cache[cache_key]
@@ -178,8 +176,7 @@ Format as: "AI Analysis: [your analysis]"
 
         cache_key = self._get_cache_key("trend", {"metric": metric_name, "data": str(trend_data)})
 
-        if 'ai_cache' not in st.session_state:
-            st.session_state.ai_cache = {}
+        st.session_state.setdefault('ai_cache', {})
 
         if cache_key in st.session_state.ai_cache:
             return st.session_state.ai_cache[cache_key]
@@ -214,8 +211,7 @@ Format as: "AI Analysis: [your recommendation]"
 
         cache_key = self._get_cache_key("rule", {"name": rule_name, **performance})
 
-        if 'ai_cache' not in st.session_state:
-            st.session_state.ai_cache = {}
+        st.session_state.setdefault('ai_cache', {})
 
         if cache_key in st.session_state.ai_cache:
             return st.session_state.ai_cache[cache_key]
@@ -246,8 +242,7 @@ Format as: "AI Analysis: [your insight]"
 
         cache_key = self._get_cache_key("pattern", {"type": pattern_type, **pattern_data})
 
-        if 'ai_cache' not in st.session_state:
-            st.session_state.ai_cache = {}
+        st.session_state.setdefault('ai_cache', {})
 
         if cache_key in st.session_state.ai_cache:
             return st.session_state.ai_cache[cache_key]
@@ -292,8 +287,7 @@ Format as: "AI Analysis: [your analysis]"
             "trend": trend
         })
 
-        if 'ai_cache' not in st.session_state:
-            st.session_state.ai_cache = {}
+        st.session_state.setdefault('ai_cache', {})
 
         if cache_key in st.session_state.ai_cache:
             return st.session_state.ai_cache[cache_key]
@@ -26,6 +26,8 @@ class FraudAPIClient:
         self.base_url = base_url.rstrip("/")
         self.token = None
         self.user_info = {}
+        # Reuse pooled connections across reruns instead of reconnecting per request
+        self.session = requests.Session()
 
     def login(self, username: str, password: str) -> Dict[str, Any]:
         """
@@ -41,7 +43,7 @@ class FraudAPIClient:
         Raises:
             requests.HTTPError: If login fails
         """
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/v1/auth/login",
             data={"username": username, "password": password}
         )
@@ -69,7 +71,7 @@ class FraudAPIClient:
 
     def health_check(self) -> Dict[str, Any]:
         """Check API health status"""
-        response = requests.get(f"{self.base_url}/")
+        response = self.session.get(f"{self.base_url}/")
         response.raise_for_status()
         return response.json()
 
@@ -83,7 +85,7 @@ class FraudAPIClient:
         Returns:
             Overview statistics
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/overview",
             headers=self._get_headers(),
             params={"time_window_hours": time_window_hours}
@@ -101,7 +103,7 @@ class FraudAPIClient:
         Returns:
             List of alerts
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/alerts/live",
             headers=self._get_headers(),
             params={"limit": limit}
@@ -119,7 +121,7 @@ class FraudAPIClient:
         Returns:
             List of rule statistics
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/rules/top",
             headers=self._get_headers(),
             params={"limit": limit}
@@ -137,7 +139,7 @@ class FraudAPIClient:
         Returns:
             Scenario breakdown data
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/scenarios/breakdown",
             headers=self._get_headers(),
             params={"time_window_hours": time_window_hours}
@@ -155,7 +157,7 @@ class FraudAPIClient:
         Returns:
             List of account changes
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/account-changes/recent",
             headers=self._get_headers(),
             params={"limit": limit}
@@ -173,7 +175,7 @@ class FraudAPIClient:
         Returns:
             Transaction details
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/transaction/{transaction_id}",
             headers=self._get_headers()
         )
@@ -197,7 +199,7 @@ class FraudAPIClient:
         Returns:
             Updated status
         """
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/v1/alert/{assessment_id}/action",
             headers=self._get_headers(),
             params={"action": action, "notes": notes}
@@ -215,7 +217,7 @@ class FraudAPIClient:
         Returns:
             Time-series data
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/metrics/time-series",
             headers=self._get_headers(),
             params={"time_range": time_range}
@@ -233,7 +235,7 @@ class FraudAPIClient:
         Returns:
             Risk distribution data
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/analytics/risk-distribution",
             headers=self._get_headers(),
             params={"time_range": time_range}
@@ -251,7 +253,7 @@ class FraudAPIClient:
         Returns:
             Money saved calculations
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/analytics/money-saved",
             headers=self._get_headers(),
             params={"time_range": time_range}
@@ -269,7 +271,7 @@ class FraudAPIClient:
         Returns:
             Module performance statistics
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/analytics/module-performance",
             headers=self._get_headers(),
             params={"time_range": time_range}
@@ -305,7 +307,7 @@ class FraudAPIClient:
             params["end_date"] = end_date
         if risk_level:
             params["risk_level"] = risk_level
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/investigation/search-transactions",
             headers=self._get_headers(),
             params=params
@@ -315,7 +317,7 @@ class FraudAPIClient:
 
     def get_account_investigation(self, account_id: str) -> Dict[str, Any]:
         """Get comprehensive account investigation data."""
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/investigation/account/{account_id}",
             headers=self._get_headers()
         )
@@ -324,7 +326,7 @@ class FraudAPIClient:
 
     def get_transaction_module_breakdown(self, transaction_id: str) -> Dict[str, Any]:
         """Get fraud module breakdown for a transaction."""
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/investigation/transaction/{transaction_id}/modules",
             headers=self._get_headers()
         )
@@ -345,7 +347,7 @@ class FraudAPIClient:
         if group_by:
             params["group_by"] = group_by
 
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/modules/catalog",
             headers=self._get_headers(),
             params=params
@@ -363,7 +365,7 @@ class FraudAPIClient:
         Returns:
             Geographic distribution of fraud activity
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/analytics/geographic-fraud",
             headers=self._get_headers(),
             params={"time_range": time_range}
@@ -388,7 +390,7 @@ class FraudAPIClient:
         Returns:
             High-value transactions with risk analysis
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/analytics/high-value-transactions",
             headers=self._get_headers(),
             params={
@@ -421,7 +423,7 @@ class FraudAPIClient:
         if severity:
             params["severity"] = severity
 
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/analytics/limit-violations",
             headers=self._get_headers(),
             params=params
@@ -444,7 +446,7 @@ class FraudAPIClient:
         Returns:
             Time-series risk score data for the account
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/analytics/account-risk-timeline/{account_id}",
             headers=self._get_headers(),
             params={"time_range": time_range}
@@ -15,8 +15,7 @@ def init_tooltip_toggle():
     Initialize the global tooltip toggle in the sidebar.
     Call this once at the start of each page.
     """
-    if "tooltips_enabled" not in st.session_state:
-        st.session_state.tooltips_enabled = True
+    st.session_state.setdefault("tooltips_enabled", True)
 
     # Add divider and toggle to sidebar for visibility
     st.sidebar.divider()
@@ -49,7 +48,8 @@ def chart_with_explanation(
     what_it_shows: str = "",
     why_it_matters: str = "",
     what_to_do: Optional[str] = None,
-    expanded: bool = False
+    expanded: bool = False,
+    key: Optional[str] = None
 ):
     """
     Render a Plotly chart with an optional explanation panel.
@@ -61,6 +61,7 @@ def chart_with_explanation(
         why_it_matters: Explanation of why this data is important for fraud detection
         what_to_do: Optional action items or recommendations
         expanded: Whether the explanation expander starts expanded (default False)
+        key: Optional stable element key so reruns update the chart in place
 
     Example:
         ```python
@@ -89,7 +90,7 @@ def chart_with_explanation(
                 st.markdown(f"**What to do:** {what_to_do}")
 
     # Render the chart
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, key=key)
 
 
 def metric_with_explanation(
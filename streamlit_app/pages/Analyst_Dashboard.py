@@ -9,7 +9,6 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 
 from streamlit_app.api_client import get_api_client
@@ -20,27 +19,6 @@ from streamlit_app.components import init_tooltip_toggle, chart_with_explanation
 # Generate synthetic dataset for visualization
 np.random.seed(42)
 
-# Rule performance data (20 rules)
-rule_names = [
-    "Transaction Amount Anomalies", "Transaction Frequency", "Recipient Verification Status",
-    "Recipient Blacklist Status", "Device Fingerprinting", "VPN or Proxy Usage",
-    "Geo-Location Flags", "Behavioral Biometrics", "Time Since Last Transaction",
-    "Social Trust Score", "Account Age", "High-Risk Transaction Times",
-    "Past Fraudulent Behavior", "Location-Inconsistent Transactions", "Normalized Transaction Amount",
-    "Transaction Context Anomalies", "Fraud Complaints Count", "Merchant Category Mismatch",
-    "User Daily Limit Exceeded", "Recent High-Value Transaction"
-]
-
-rule_performance_df = pd.DataFrame({
-    'rule_name': rule_names,
-    'trigger_frequency': np.random.randint(50, 500, 20),
-    'precision': np.random.uniform(0.65, 0.98, 20),
-    'false_positive_rate': np.random.uniform(0.02, 0.35, 20),
-    'avg_contribution': np.random.uniform(5, 35, 20),
-    'confirmed_fraud_count': np.random.randint(10, 200, 20),
-    'rule_weight': [32, 35, 26, 22, 30, 22, 32, 15, 24, 18, 8, 28, 35, 20, 18, 24, 12, 4, 10, 6]
-})
-
 # Analyst decision data (30 days)
 dates = pd.date_range(end=datetime.now(), periods=30, freq='D')
 analyst_decisions_df = pd.DataFrame({
@@ -52,6 +30,171 @@ analyst_decisions_df = pd.DataFrame({
 analyst_decisions_df['total'] = analyst_decisions_df[['cleared', 'rejected', 'escalated']].sum(axis=1)
 analyst_decisions_df['confidence'] = np.minimum(50 + np.arange(30) * 1.2 + np.random.uniform(-5, 5, 30), 95)
 
+# Recent high-risk alerts (static)
+recent_alerts_df = pd.DataFrame({
+    'Time': ['10 min ago', '25 min ago', '1 hr ago', '2 hr ago', '3 hr ago'],
+    'Transaction ID': ['TXN-78945', 'TXN-78932', 'TXN-78901', 'TXN-78876', 'TXN-78834'],
+    'Amount': ['$15,000', '$12,500', '$45,000', '$3,200', '$8,900'],
+    'Risk Score': [0.89, 0.96, 0.91, 0.88, 0.84],
+    'Status': ['Under Review', 'Blocked', 'Escalated', 'Under Review', 'Cleared'],
+    'Scenario': ['Large Transfer', 'Account Takeover', 'Vendor Impersonation', 'Duplicate Check', 'Odd Hours']
+})
+
+# Transaction lifecycle funnel (static)
+funnel_df = pd.DataFrame({
+    'Stage': ['Total Transactions', 'Auto-Cleared', 'Manual Review', 'Rejected', 'Fraud Confirmed'],
+    'Count': [12547, 11915, 632, 85, 47],
+    'Percentage': [100, 95, 5, 0.68, 0.37]
+})
+
+
+def _current_hour():
+    """Now, truncated to the hour, as a stable cache key"""
+    return datetime.now().replace(minute=0, second=0, microsecond=0)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _build_hourly_activity(anchor):
+    """Synthetic transaction volume and fraud counts for the 24 hours ending at anchor"""
+    hours = pd.date_range(end=anchor, periods=24, freq='h')
+    transactions = np.random.poisson(lam=500, size=24) + np.random.randint(-50, 100, 24)
+    fraud_detected = np.random.poisson(lam=2, size=24)
+    return hours, transactions, fraud_detected
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _build_model_trends():
+    """Synthetic 7-day accuracy, precision and recall series"""
+    ml_days = pd.date_range(end=datetime.now(), periods=7, freq='D')
+    ml_accuracy = [0.932 + i * 0.0015 + np.random.uniform(-0.005, 0.005) for i in range(7)]
+    ml_precision = [0.918 + i * 0.002 + np.random.uniform(-0.005, 0.005) for i in range(7)]
+    ml_recall = [0.895 + i * 0.0025 + np.random.uniform(-0.005, 0.005) for i in range(7)]
+    return ml_days, ml_accuracy, ml_precision, ml_recall
+
+
+@st.cache_data(show_spinner=False)
+def _build_confidence_scores():
+    """Seeded synthetic distribution of model confidence scores"""
+    rng = np.random.default_rng(42)
+    return np.concatenate([
+        rng.beta(8, 2, 400),
+        rng.beta(2, 2, 100)
+    ]) * 100
+
+
+@st.cache_resource(show_spinner=False)
+def _build_funnel_fig():
+    """Transaction lifecycle funnel figure"""
+    colors = get_chart_colors()
+
+    fig_funnel = go.Figure(go.Funnel(
+        y=funnel_df['Stage'],
+        x=funnel_df['Count'],
+        textinfo="value+percent initial",
+        marker=dict(color=colors['funnel'])
+    ))
+
+    fig_funnel.update_layout(
+        height=280,
+        showlegend=False,
+        margin=dict(l=10, r=10, t=10, b=10),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig_funnel
+
+
+@st.cache_resource(show_spinner=False)
+def _build_decisions_fig():
+    """Stacked daily analyst decisions with confidence overlay"""
+    colors = get_chart_colors()
+
+    decision_dates = analyst_decisions_df['date'].to_numpy()
+
+    fig_decisions = go.Figure()
+
+    fig_decisions.add_trace(go.Bar(
+        x=decision_dates,
+        y=analyst_decisions_df['cleared'].to_numpy(),
+        name='Cleared',
+        marker_color=colors['success']
+    ))
+
+    fig_decisions.add_trace(go.Bar(
+        x=decision_dates,
+        y=analyst_decisions_df['rejected'].to_numpy(),
+        name='Rejected',
+        marker_color=colors['danger']
+    ))
+
+    fig_decisions.add_trace(go.Bar(
+        x=decision_dates,
+        y=analyst_decisions_df['escalated'].to_numpy(),
+        name='Escalated',
+        marker_color=colors['warning']
+    ))
+
+    fig_decisions.add_trace(go.Scatter(
+        x=decision_dates,
+        y=analyst_decisions_df['confidence'].to_numpy(),
+        name='Confidence %',
+        yaxis='y2',
+        line=dict(color=colors['primary'], width=2)
+    ))
+
+    fig_decisions.update_layout(
+        barmode='stack',
+        height=280,
+        margin=dict(l=10, r=10, t=10, b=10),
+        yaxis=dict(title='Count', title_font_size=11),
+        yaxis2=dict(title='Confidence %', overlaying='y', side='right', range=[0, 100], title_font_size=11),
+        hovermode='x unified',
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1, font=dict(size=10)),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig_decisions
+
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _build_activity_fig(anchor):
+    """24-hour transaction volume and fraud detections figure"""
+    colors = get_chart_colors()
+    hours, transactions, fraud_detected = _build_hourly_activity(anchor)
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scattergl(
+        x=hours,
+        y=transactions,
+        name='Total Transactions',
+        line=dict(color=colors['primary'], width=2),
+        fill='tozeroy',
+        fillcolor='rgba(102, 126, 234, 0.1)'
+    ))
+
+    fig.add_trace(go.Scattergl(
+        x=hours,
+        y=fraud_detected,
+        name='Fraud Detected',
+        line=dict(color=colors['danger'], width=2),
+        mode='lines+markers',
+        yaxis='y2'
+    ))
+
+    fig.update_layout(
+        yaxis=dict(title='Transaction Volume', title_font_size=11),
+        yaxis2=dict(title='Fraud Cases', overlaying='y', side='right', title_font_size=11),
+        hovermode='x unified',
+        height=280,
+        margin=dict(l=10, r=10, t=10, b=10),
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1, font=dict(size=10)),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
 def render():
     """Render the Homepage"""
 
@@ -322,17 +465,8 @@ def render():
     # Wrap table in card
     # Create alert card with proper container
     with st.container():
-        recent_alerts = pd.DataFrame({
-            'Time': ['10 min ago', '25 min ago', '1 hr ago', '2 hr ago', '3 hr ago'],
-            'Transaction ID': ['TXN-78945', 'TXN-78932', 'TXN-78901', 'TXN-78876', 'TXN-78834'],
-            'Amount': ['$15,000', '$12,500', '$45,000', '$3,200', '$8,900'],
-            'Risk Score': [0.89, 0.96, 0.91, 0.88, 0.84],
-            'Status': ['Under Review', 'Blocked', 'Escalated', 'Under Review', 'Cleared'],
-            'Scenario': ['Large Transfer', 'Account Takeover', 'Vendor Impersonation', 'Duplicate Check', 'Odd Hours']
-        })
-
         st.dataframe(
-            recent_alerts,
+            recent_alerts_df,
             use_container_width=True,
             hide_index=True,
             height=220,
@@ -411,26 +545,7 @@ def render():
     with col1:
         st.markdown("<div class='subsection-header'><h3>🤖 Transaction Lifecycle Monitor</h3></div>", unsafe_allow_html=True)
 
-        funnel_data = pd.DataFrame({
-            'Stage': ['Total Transactions', 'Auto-Cleared', 'Manual Review', 'Rejected', 'Fraud Confirmed'],
-            'Count': [12547, 11915, 632, 85, 47],
-            'Percentage': [100, 95, 5, 0.68, 0.37]
-        })
-
-        fig_funnel = go.Figure(go.Funnel(
-            y=funnel_data['Stage'],
-            x=funnel_data['Count'],
-            textinfo="value+percent initial",
-            marker=dict(color=colors['funnel'])
-        ))
-
-        fig_funnel.update_layout(
-            height=280,
-            showlegend=False,
-            margin=dict(l=10, r=10, t=10, b=10),
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)'
-        )
+        fig_funnel = _build_funnel_fig()
         chart_with_explanation(
             fig_funnel,
             title="Transaction Lifecycle Funnel",
@@ -450,48 +565,7 @@ def render():
     with col2:
         st.markdown("<div class='subsection-header'><h3>🧠 Decision Pattern Analytics</h3></div>", unsafe_allow_html=True)
 
-        fig_decisions = go.Figure()
-
-        fig_decisions.add_trace(go.Bar(
-            x=analyst_decisions_df['date'],
-            y=analyst_decisions_df['cleared'],
-            name='Cleared',
-            marker_color=colors['success']
-        ))
-
-        fig_decisions.add_trace(go.Bar(
-            x=analyst_decisions_df['date'],
-            y=analyst_decisions_df['rejected'],
-            name='Rejected',
-            marker_color=colors['danger']
-        ))
-
-        fig_decisions.add_trace(go.Bar(
-            x=analyst_decisions_df['date'],
-            y=analyst_decisions_df['escalated'],
-            name='Escalated',
-            marker_color=colors['warning']
-        ))
-
-        fig_decisions.add_trace(go.Scatter(
-            x=analyst_decisions_df['date'],
-            y=analyst_decisions_df['confidence'],
-            name='Confidence %',
-            yaxis='y2',
-            line=dict(color=colors['primary'], width=2)
-        ))
-
-        fig_decisions.update_layout(
-            barmode='stack',
-            height=280,
-            margin=dict(l=10, r=10, t=10, b=10),
-            yaxis=dict(title='Count', title_font_size=11),
-            yaxis2=dict(title='Confidence %', overlaying='y', side='right', range=[0, 100], title_font_size=11),
-            hovermode='x unified',
-            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1, font=dict(size=10)),
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)'
-        )
+        fig_decisions = _build_decisions_fig()
 
         chart_with_explanation(
             fig_decisions,
@@ -512,40 +586,7 @@ def render():
     with st.container():
         st.markdown("<div class='subsection-header'><h3>📊 Real-Time Transaction Flow</h3></div>", unsafe_allow_html=True)
 
-        hours = pd.date_range(end=datetime.now(), periods=24, freq='H')
-        transactions = np.random.poisson(lam=500, size=24) + np.random.randint(-50, 100, 24)
-        fraud_detected = np.random.poisson(lam=2, size=24)
-
-        fig = go.Figure()
-
-        fig.add_trace(go.Scatter(
-            x=hours,
-            y=transactions,
-            name='Total Transactions',
-            line=dict(color=colors['primary'], width=2),
-            fill='tozeroy',
-            fillcolor='rgba(102, 126, 234, 0.1)'
-        ))
-
-        fig.add_trace(go.Scatter(
-            x=hours,
-            y=fraud_detected,
-            name='Fraud Detected',
-            line=dict(color=colors['danger'], width=2),
-            mode='lines+markers',
-            yaxis='y2'
-        ))
-
-        fig.update_layout(
-            yaxis=dict(title='Transaction Volume', title_font_size=11),
-            yaxis2=dict(title='Fraud Cases', overlaying='y', side='right', title_font_size=11),
-            hovermode='x unified',
-            height=280,
-            margin=dict(l=10, r=10, t=10, b=10),
-            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1, font=dict(size=10)),
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)'
-        )
+        fig = _build_activity_fig(_current_hour())
 
         chart_with_explanation(
             fig,
@@ -584,10 +625,7 @@ def render():
     with ml_viz_col1:
         st.markdown("<div class='subsection-header'><h3>🎯 Model Performance Trends</h3></div>", unsafe_allow_html=True)
 
-        ml_days = pd.date_range(end=datetime.now(), periods=7, freq='D')
-        ml_accuracy = [0.932 + i * 0.0015 + np.random.uniform(-0.005, 0.005) for i in range(7)]
-        ml_precision = [0.918 + i * 0.002 + np.random.uniform(-0.005, 0.005) for i in range(7)]
-        ml_recall = [0.895 + i * 0.0025 + np.random.uniform(-0.005, 0.005) for i in range(7)]
+        ml_days, ml_accuracy, ml_precision, ml_recall = _build_model_trends()
 
         fig_ml_perf = go.Figure()
 
@@ -636,11 +674,7 @@ def render():
     with ml_viz_col2:
         st.markdown("<div class='subsection-header'><h3>📊 Prediction Confidence</h3></div>", unsafe_allow_html=True)
 
-        np.random.seed(42)
-        confidence_scores = np.concatenate([
-            np.random.beta(8, 2, 400),
-            np.random.beta(2, 2, 100)
-        ]) * 100
+        confidence_scores = _build_confidence_scores()
 
         fig_conf = go.Figure()
 
@@ -8,7 +8,6 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 
 from streamlit_app.api_client import get_api_client
@@ -42,17 +41,6 @@ rule_performance_df = pd.DataFrame({
     'rule_weight': [32, 35, 26, 22, 30, 22, 32, 15, 24, 18, 8, 28, 35, 20, 18, 24, 12, 4, 10, 6]
 })
 
-# Analyst decision data (30 days)
-dates = pd.date_range(end=datetime.now(), periods=30, freq='D')
-analyst_decisions_df = pd.DataFrame({
-    'date': dates,
-    'cleared': np.random.randint(150, 250, 30),
-    'rejected': np.random.randint(20, 80, 30),
-    'escalated': np.random.randint(10, 40, 30)
-})
-analyst_decisions_df['total'] = analyst_decisions_df[['cleared', 'rejected', 'escalated']].sum(axis=1)
-analyst_decisions_df['confidence'] = np.minimum(50 + np.arange(30) * 1.2 + np.random.uniform(-5, 5, 30), 95)
-
 
 def render():
     """Render the Summary Dashboard page"""
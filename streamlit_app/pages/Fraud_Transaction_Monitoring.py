@@ -8,9 +8,9 @@ Search transactions, investigate accounts, and analyze fraud detection module ou
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from html import escape
 from typing import Dict, Any, List
 
 from streamlit_app.api_client import get_api_client
@@ -20,9 +20,47 @@ from streamlit_app.explainability import get_explainability_engine
 from streamlit_app.components import init_tooltip_toggle, chart_with_explanation
 
 
+CURRENCY_FORMAT = "${:,.2f}"
+
+TX_DETAILS_TEMPLATE = (
+    "<div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 16px;'>"
+    "<div><h4>Transaction Details</h4>"
+    "<p><strong>ID:</strong> {transaction_id}<br>"
+    "<strong>Account:</strong> {account_id}<br>"
+    "<strong>Amount:</strong> {amount}<br>"
+    "<strong>Direction:</strong> {direction}</p></div>"
+    "<div><h4>Risk Information</h4>"
+    "<p><strong>Risk Score:</strong> {risk_score:.3f}<br>"
+    "<strong>Decision:</strong> {decision}<br>"
+    "<strong>Status:</strong> {review_status}<br>"
+    "<strong>Rules Triggered:</strong> {triggered_rules_count}</p></div>"
+    "<div><h4>Other Info</h4>"
+    "<p><strong>Type:</strong> {transaction_type}<br>"
+    "<strong>Counterparty:</strong> {counterparty_id}<br>"
+    "<strong>Timestamp:</strong> {timestamp}</p></div>"
+    "</div>"
+)
+
+# Module severity colors
+SEVERITY_COLORS = {
+    "high": "#ff4444",
+    "medium": "#ff8800",
+    "low": "#ffaa00"
+}
+
+MODULE_CARD_TEMPLATE = (
+    "<div style='background-color: {color}15; border-left: 4px solid {color}; padding: 15px; "
+    "border-radius: 5px; margin-bottom: 10px;'>"
+    "<h4 style='margin: 0; color: {color};'>{title}</h4>"
+    "<p style='margin: 5px 0;'><strong>Weight:</strong> {weight:.3f} | "
+    "<strong>Category:</strong> {category} | <strong>Severity:</strong> {severity}</p>"
+    "</div>"
+)
+
+
 def format_currency(amount):
     """Format amount as currency"""
-    return f"${amount:,.2f}"
+    return CURRENCY_FORMAT.format(amount)
 
 
 def format_timestamp(timestamp_str):
@@ -34,6 +72,38 @@ def format_timestamp(timestamp_str):
         return timestamp_str
 
 
+def format_timestamps(timestamps: pd.Series) -> pd.Series:
+    """Format a column of ISO timestamps in UTC, keeping unparseable values as-is"""
+    parsed = pd.to_datetime(timestamps, utc=True, errors='coerce', format='ISO8601')
+    return parsed.dt.strftime("%Y-%m-%d %H:%M:%S").fillna(timestamps)
+
+
+# API results are cached per auth token so users never see each other's data;
+# the leading underscore keeps the client object out of the cache key
+@st.cache_data(ttl=30, show_spinner=False)
+def _search_transactions(_client, token, **filters):
+    """Cached transaction search"""
+    return _client.search_transactions(**filters)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _get_module_breakdown(_client, token, transaction_id):
+    """Cached module breakdown for a transaction"""
+    return _client.get_transaction_module_breakdown(transaction_id)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _get_account_risk_timeline(_client, token, account_id, time_range):
+    """Cached risk timeline for an account"""
+    return _client.get_account_risk_timeline(account_id, time_range)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _get_account_investigation(_client, token, account_id):
+    """Cached account investigation data"""
+    return _client.get_account_investigation(account_id)
+
+
 # def render_transaction_search():
 #     """Render transaction search interface"""
 #     st.markdown("### 🔍 AI-Powered Transaction Intelligence Search")
@@ -178,21 +248,26 @@ def render_transaction_search():
 
         search_button = st.form_submit_button("🔍 Search", use_container_width=True)
 
+    # Keep the last submitted filters so results survive row selection reruns
     if search_button:
+        st.session_state.transaction_search_filters = dict(
+            transaction_id=transaction_id if transaction_id else None,
+            account_id=account_id if account_id else None,
+            min_amount=min_amount if min_amount > 0 else None,
+            max_amount=max_amount if max_amount < 100000 else None,
+            start_date=start_date.isoformat() if start_date else None,
+            end_date=end_date.isoformat() if end_date else None,
+            risk_level=risk_level.lower() if risk_level != "All" else None,
+            limit=limit
+        )
+
+    filters = st.session_state.get("transaction_search_filters")
+    if filters:
         client = get_api_client()
 
         try:
             with st.spinner("Searching transactions..."):
-                results = client.search_transactions(
-                    transaction_id=transaction_id if transaction_id else None,
-                    account_id=account_id if account_id else None,
-                    min_amount=min_amount if min_amount > 0 else None,
-                    max_amount=max_amount if max_amount < 100000 else None,
-                    start_date=start_date.isoformat() if start_date else None,
-                    end_date=end_date.isoformat() if end_date else None,
-                    risk_level=risk_level.lower() if risk_level != "All" else None,
-                    limit=limit
-                )
+                results = _search_transactions(client, client.token, **filters)
 
             transactions = results.get("transactions", [])
 
@@ -351,70 +426,108 @@ def render_transaction_search():
             st.divider()
             st.markdown("#### Results")
 
-            # =====================================
-            # Existing per-transaction expanders
-            # =====================================
-            for idx, tx in enumerate(transactions):
-                with st.expander(
-                    f"**{tx['transaction_id']}** - {format_currency(tx['amount'])} - "
-                    f"{tx.get('transaction_type', 'N/A')} - Risk: {tx.get('risk_score', 0):.2f}",
-                    expanded=(idx == 0)
-                ):
-                    col1, col2, col3 = st.columns(3)
-
-                    with col1:
-                        st.markdown("#### Transaction Details")
-                        st.markdown(f"**ID:** {tx['transaction_id']}")
-                        st.markdown(f"**Account:** {tx['account_id']}")
-                        st.markdown(f"**Amount:** {format_currency(tx['amount'])}")
-                        st.markdown(f"**Direction:** {tx.get('direction', 'N/A')}")
-
-                    with col2:
-                        st.markdown("#### Risk Information")
-                        risk_score = float(tx.get('risk_score', 0) or 0)
-                        st.markdown(f"**Risk Score:** {risk_score:.3f}")
-                        st.markdown(f"**Decision:** {tx.get('decision', 'N/A')}")
-                        st.markdown(f"**Status:** {tx.get('review_status', 'N/A')}")
-                        st.markdown(f"**Rules Triggered:** {tx.get('triggered_rules_count', 0)}")
-
-                    with col3:
-                        st.markdown("#### Other Info")
-                        st.markdown(f"**Type:** {tx.get('transaction_type', 'N/A')}")
-                        st.markdown(f"**Counterparty:** {tx.get('counterparty_id', 'N/A')}")
-                        st.markdown(f"**Timestamp:** {format_timestamp(tx.get('timestamp', ''))}")
-
-                    # AI Analysis Section
-                    st.markdown("---")
-                    st.markdown("#### 🤖 AI Analysis")
-
-                    ai_engine = get_ai_engine()
-                    tx_recommendation = ai_engine.get_risk_recommendation(
-                        risk_score=risk_score,
-                        amount=tx['amount'],
-                        context={
-                            'type': tx.get('transaction_type', 'Unknown'),
-                            'rules_triggered': tx.get('triggered_rules_count', 0),
-                            'decision': tx.get('decision', 'N/A')
-                        }
+            results_df = pd.DataFrame({
+                "Transaction ID": tx_ids,
+                "Account": [t.get('account_id', 'N/A') for t in transactions],
+                "Amount": amounts,
+                "Type": [t.get('transaction_type', 'N/A') for t in transactions],
+                "Risk Score": risk_scores,
+                "Decision": [t.get('decision', 'N/A') for t in transactions],
+                "Status": [t.get('review_status', 'N/A') for t in transactions]
+            })
+
+            selection = st.dataframe(
+                results_df,
+                use_container_width=True,
+                hide_index=True,
+                on_select="rerun",
+                selection_mode="single-row",
+                key="transaction_results",
+                column_config={
+                    'Amount': st.column_config.NumberColumn('Amount', format='$%.2f'),
+                    'Risk Score': st.column_config.ProgressColumn(
+                        'Risk Score',
+                        min_value=0,
+                        max_value=1,
+                        format='%.2f'
                     )
+                }
+            )
+            st.caption("Select a row to inspect a transaction.")
 
-                    st.info(tx_recommendation)
-
-                    # Action buttons
-                    btn_col1, btn_col2, btn_col3 = st.columns(3)
-                    with btn_col1:
-                        if st.button(f"View Module Breakdown", key=f"modules_{idx}"):
-                            st.session_state.view_module_breakdown = tx['transaction_id']
-                    with btn_col2:
-                        if st.button(f"Investigate Account", key=f"account_{idx}"):
-                            st.session_state.investigate_account = tx['account_id']
-                    with btn_col3:
-                        st.markdown("")  # Spacing
+            # A stale selection can point past a shorter result set
+            selected_rows = [row for row in selection.selection.rows if row < len(transactions)]
+            render_transaction_details(transactions[selected_rows[0] if selected_rows else 0])
 
         except Exception as e:
             st.error(f"Search failed: {str(e)}")
 
 
+def _open_view(view_key, value):
+    """Button callback: switch to a drill-down view before the rerun starts"""
+    st.session_state[view_key] = value
+
+
+def _close_view(view_key):
+    """Button callback: leave a drill-down view before the rerun starts"""
+    st.session_state.pop(view_key, None)
+
+
+def render_transaction_details(tx: Dict[str, Any]):
+    """Render the detail panel for one search result"""
+    with st.container(border=True):
+        risk_score = float(tx.get('risk_score', 0) or 0)
+        st.markdown(TX_DETAILS_TEMPLATE.format(
+            transaction_id=escape(str(tx['transaction_id'])),
+            account_id=escape(str(tx['account_id'])),
+            amount=format_currency(tx['amount']),
+            direction=escape(str(tx.get('direction', 'N/A'))),
+            risk_score=risk_score,
+            decision=escape(str(tx.get('decision', 'N/A'))),
+            review_status=escape(str(tx.get('review_status', 'N/A'))),
+            triggered_rules_count=tx.get('triggered_rules_count', 0),
+            transaction_type=escape(str(tx.get('transaction_type', 'N/A'))),
+            counterparty_id=escape(str(tx.get('counterparty_id', 'N/A'))),
+            timestamp=escape(str(format_timestamp(tx.get('timestamp', ''))))
+        ), unsafe_allow_html=True)
+
+        # AI Analysis Section
+        st.markdown("---")
+        st.markdown("#### 🤖 AI Analysis")
+
+        ai_engine = get_ai_engine()
+        tx_recommendation = ai_engine.get_risk_recommendation(
+            risk_score=risk_score,
+            amount=tx['amount'],
+            context={
+                'type': tx.get('transaction_type', 'Unknown'),
+                'rules_triggered': tx.get('triggered_rules_count', 0),
+                'decision': tx.get('decision', 'N/A')
+            }
+        )
+
+        st.info(tx_recommendation)
+
+        # Action buttons
+        btn_col1, btn_col2, btn_col3 = st.columns(3)
+        with btn_col1:
+            st.button(
+                "View Module Breakdown",
+                key=f"modules_{tx['transaction_id']}",
+                on_click=_open_view,
+                args=("view_module_breakdown", tx['transaction_id'])
+            )
+        with btn_col2:
+            st.button(
+                "Investigate Account",
+                key=f"account_{tx['transaction_id']}",
+                on_click=_open_view,
+                args=("investigate_account", tx['account_id'])
+            )
+        with btn_col3:
+            st.markdown("")  # Spacing
+
+
 def render_module_breakdown(transaction_id: str):
     """Render fraud detection module breakdown"""
     st.markdown(f"### 🔬 Detection Module Analytics - {transaction_id}")
@@ -423,7 +536,7 @@ def render_module_breakdown(transaction_id: str):
 
     try:
         with st.spinner("Loading module breakdown..."):
-            breakdown = client.get_transaction_module_breakdown(transaction_id)
+            breakdown = _get_module_breakdown(client, client.token, transaction_id)
 
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -448,58 +561,36 @@ def render_module_breakdown(transaction_id: str):
         # Create DataFrame
         df = pd.DataFrame(modules)
 
-        # Color code by severity
-        def get_severity_color(severity):
-            colors = {
-                "high": "#ff4444",
-                "medium": "#ff8800",
-                "low": "#ffaa00"
-            }
-            return colors.get(severity, "#cccccc")
-
         # Display as colored cards
-        for idx, module in enumerate(modules):
+        cards = []
+        for module in modules:
             severity = module.get("severity", "low")
-            color = get_severity_color(severity)
-
-            st.markdown(
-                f"""
-                <div style="
-                    background-color: {color}15;
-                    border-left: 4px solid {color};
-                    padding: 15px;
-                    border-radius: 5px;
-                    margin-bottom: 10px;
-                ">
-                    <h4 style="margin: 0; color: {color};">
-                        {module.get('description', module.get('name', 'Unknown Module'))}
-                    </h4>
-                    <p style="margin: 5px 0;">
-                        <strong>Weight:</strong> {module.get('weight', 0):.3f} |
-                        <strong>Category:</strong> {module.get('category', 'general')} |
-                        <strong>Severity:</strong> {severity.upper()}
-                    </p>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
+            cards.append(MODULE_CARD_TEMPLATE.format(
+                color=SEVERITY_COLORS.get(severity, "#cccccc"),
+                title=escape(str(module.get('description', module.get('name', 'Unknown Module')))),
+                weight=module.get('weight', 0),
+                category=escape(str(module.get('category', 'general'))),
+                severity=escape(severity.upper())
+            ))
+        st.markdown("".join(cards), unsafe_allow_html=True)
 
         # Summary chart
         st.markdown("#### 🎯 Module Contribution Weights")
-        fig = px.bar(
-            df,
-            x="weight",
-            y="description",
-            orientation='h',
-            color="severity",
-            color_discrete_map={
-                "high": "#ff4444",
-                "medium": "#ff8800",
-                "low": "#ffaa00"
-            },
-            title="Triggered Modules by Weight"
+        fig = go.Figure()
+        for severity, severity_df in df.groupby("severity", sort=False):
+            fig.add_trace(go.Bar(
+                x=severity_df["weight"],
+                y=severity_df["description"],
+                orientation='h',
+                name=severity,
+                marker_color=SEVERITY_COLORS.get(severity, "#cccccc")
+            ))
+        fig.update_layout(
+            title="Triggered Modules by Weight",
+            xaxis_title="Weight",
+            height=400,
+            showlegend=True
         )
-        fig.update_layout(height=400, showlegend=True)
         st.plotly_chart(fig, use_container_width=True)
 
     except Exception as e:
@@ -512,7 +603,7 @@ def render_account_risk_timeline(account_id: str, time_range: str = "7d"):
 
     try:
         with st.spinner("Loading risk timeline..."):
-            timeline_data = client.get_account_risk_timeline(account_id, time_range)
+            timeline_data = _get_account_risk_timeline(client, client.token, account_id, time_range)
 
         timeline = timeline_data.get("timeline", [])
         statistics = timeline_data.get("statistics", {})
@@ -630,9 +721,9 @@ def render_account_risk_timeline(account_id: str, time_range: str = "7d"):
             ]].copy()
 
             display_df['timestamp'] = display_df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
-            display_df['amount'] = display_df['amount'].apply(format_currency)
-            display_df['risk_score'] = display_df['risk_score'].apply(lambda x: f"{x:.3f}")
-            display_df['moving_average'] = display_df['moving_average'].apply(lambda x: f"{x:.3f}")
+            display_df['amount'] = display_df['amount'].map(CURRENCY_FORMAT.format)
+            display_df['risk_score'] = display_df['risk_score'].map('{:.3f}'.format)
+            display_df['moving_average'] = display_df['moving_average'].map('{:.3f}'.format)
 
             display_df.columns = [
                 'Timestamp', 'Transaction ID', 'Amount', 'Risk Score',
@@ -653,7 +744,7 @@ def render_account_investigation(account_id: str):
 
     try:
         with st.spinner("Loading account information..."):
-            account_data = client.get_account_investigation(account_id)
+            account_data = _get_account_investigation(client, client.token, account_id)
 
         # Account Overview
         col1, col2, col3 = st.columns(3)
@@ -719,8 +810,8 @@ def render_account_investigation(account_id: str):
 
         if recent_txs:
             tx_df = pd.DataFrame(recent_txs)
-            tx_df["amount"] = tx_df["amount"].apply(format_currency)
-            tx_df["timestamp"] = tx_df["timestamp"].apply(format_timestamp)
+            tx_df["amount"] = tx_df["amount"].map(CURRENCY_FORMAT.format)
+            tx_df["timestamp"] = format_timestamps(tx_df["timestamp"])
             st.dataframe(tx_df, use_container_width=True, hide_index=True)
         else:
             st.info("No recent transactions")
@@ -838,17 +929,13 @@ def render():
     # Check if we need to show specific views
     if "view_module_breakdown" in st.session_state:
         transaction_id = st.session_state.view_module_breakdown
-        if st.button("← Back to Search"):
-            del st.session_state.view_module_breakdown
-            st.rerun()
+        st.button("← Back to Search", on_click=_close_view, args=("view_module_breakdown",))
         render_module_breakdown(transaction_id)
         return
 
     if "investigate_account" in st.session_state:
         account_id = st.session_state.investigate_account
-        if st.button("← Back to Search"):
-            del st.session_state.investigate_account
-            st.rerun()
+        st.button("← Back to Search", on_click=_close_view, args=("investigate_account",))
         render_account_investigation(account_id)
         return
 
@@ -6,16 +6,80 @@ Deep-dive analysis of 13 fraud scenarios with detailed timelines and rule breakd
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
+from html import escape
+from operator import itemgetter
 
-from streamlit_app.theme import apply_master_theme, render_page_header, get_chart_colors
+from streamlit_app.theme import apply_master_theme, render_page_header
 from streamlit_app.ai_recommendations import get_ai_engine, render_ai_insight
 from streamlit_app.explainability import get_explainability_engine
 from streamlit_app.components import init_tooltip_toggle, chart_with_explanation
 
 
+# Severity assessment used in rule hover text
+_SEVERITY_INFO = {
+    'critical': {
+        'badge': '🔴 CRITICAL',
+        'color': '#dc2626',
+        'impact': 'Major fraud indicator - Extremely suspicious behavior',
+        'action': 'This alone warrants investigation'
+    },
+    'high': {
+        'badge': '🟠 HIGH',
+        'color': '#f59e0b',
+        'impact': 'Strong fraud signal - Significant risk factor',
+        'action': 'Important contributor to overall risk'
+    },
+    'medium': {
+        'badge': '🟡 MODERATE',
+        'color': '#eab308',
+        'impact': 'Notable concern - Adds to risk profile',
+        'action': 'Supporting evidence for fraud detection'
+    },
+    'low': {
+        'badge': '🔵 LOW',
+        'color': '#3b82f6',
+        'impact': 'Minor flag - Supplementary indicator',
+        'action': 'Minimal contribution to risk score'
+    }
+}
+
+# Severity indicators for the rule table
+_SEVERITY_EMOJI = {'critical': '🔴', 'high': '🟠', 'medium': '🟡', 'low': '🔵'}
+
+# HTML templates for section headers and the AI analysis box
+_SECTION_HEADER = (
+    "<div class='section-header' style='margin-top: 28px;'>"
+    "<h2>{icon} {title}</h2><span class='section-badge'>{badge}</span></div>"
+)
+_AI_INSIGHT_TEMPLATE = (
+    "<div style='background: linear-gradient(135deg, #e3f2fd, #bbdefb); padding: 16px; border-radius: 10px; "
+    "border-left: 5px solid #2196f3; margin-top: 16px;'>"
+    "<div style='color: #1565c0; font-size: 0.9rem; line-height: 1.6;'>{insight}</div></div>"
+)
+
+# Rule bar colors by severity
+_SEVERITY_COLOR = {
+    'critical': '#ef4444', 'high': '#f97316', 'medium': '#eab308', 'low': '#3b82f6'
+}
+
+# Log10 floor and tick labels for the testing-pattern amount axis
+_LOG_AXIS_FLOOR = -1
+_LOG_AXIS_TICKS = {
+    'tickvals': [-1, 0, 1, 2, 3, 4],
+    'ticktext': ['0.1', '1', '10', '100', '1K', '10K']
+}
+
+# Timeline status indicators
+_TIMELINE_EMOJI = {
+    'normal': '🟢', 'warning': '🟡', 'flagged': '🟠', 'critical': '🔴',
+    'blocked': '🟣', 'review': '🔵', 'resolved': '⚫', 'escalated': '🔴',
+    'reported': '🟠', 'monitoring': '🔵', 'logged': '⚫'
+}
+
+
 # Complete fraud scenarios dataset (all 13 scenarios)
 fraud_scenarios = {
     "1. Large Transfer - Low Activity": {
@@ -528,275 +592,372 @@ fraud_scenarios = {
 }
 
 
-def render():
-    """Render the Fraud Scenario Analysis page"""
+def _build_timeline_html(scenario_key):
+    """Detection timeline of a scenario as a single HTML block"""
+    return "<div class='timeline'>" + "".join(
+        f"<div class='timeline-item'>{_TIMELINE_EMOJI.get(row['status'], '⚪')} "
+        f"<b>{row['time']}</b> - {row['event']}</div>"
+        for row in fraud_scenarios[scenario_key]['timeline']
+    ) + "</div>"
 
-    # Apply theme
-    apply_master_theme()
-    init_tooltip_toggle()
 
-    # Professional CSS for aesthetic design
-    st.markdown("""
-    <style>
-    /* Global Aesthetics */
-    .block-container {
-        padding-top: 0.5rem;
-        padding-bottom: 1rem;
-    }
+def _build_metrics_html(scenario_key):
+    """Key detection metrics of a scenario as a single HTML grid"""
+    return "<div class='metric-grid'>" + "".join(
+        f"<div class='metric-box'><div class='metric-label'>{escape(label)}</div>"
+        f"<div class='metric-value'>{escape(value)}</div></div>"
+        for label, value in fraud_scenarios[scenario_key]['metrics'].items()
+    ) + "</div>"
 
-    /* Professional Card Styling */
-    .dashboard-card {
-        background: white;
-        border-radius: 12px;
-        padding: 20px;
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
-        margin-bottom: 20px;
-        border-left: 4px solid transparent;
-        transition: all 0.3s ease;
-    }
 
-    .dashboard-card:hover {
-        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.12);
-        transform: translateY(-2px);
-    }
+def _build_rule_frame(scenario_key):
+    """Rule names, weights, colors and hover text sorted by weight, plus total weight and critical count"""
+    scenario = fraud_scenarios[scenario_key]
 
-    .dashboard-card.critical {
-        border-left-color: #E54848;
-        background: linear-gradient(to right, #fff5f5 0%, white 10%);
-    }
+    rules_sorted = sorted(scenario['triggered_rules'], key=itemgetter('weight'))
+    names = [r['name'] for r in rules_sorted]
+    weights = [r['weight'] for r in rules_sorted]
+    colors = [_SEVERITY_COLOR[r['severity']] for r in rules_sorted]
 
-    .dashboard-card.success {
-        border-left-color: #2E865F;
-        background: linear-gradient(to right, #f0fdf4 0%, white 10%);
-    }
+    # Enhanced hover texts with explainability
+    rule_hover_texts = []
+    total_weight = sum(weights)
+    critical_count = 0
 
-    .dashboard-card.primary {
-        border-left-color: #667eea;
-        background: linear-gradient(to right, #f5f7ff 0%, white 10%);
-    }
+    for rule in rules_sorted:
+        rule_name = rule['name']
+        weight = rule['weight']
+        detail = rule['detail']
+        severity = rule['severity']
+        if severity == 'critical':
+            critical_count += 1
 
-    .dashboard-card.warning {
-        border-left-color: #F3B65B;
-        background: linear-gradient(to right, #fffbf0 0%, white 10%);
-    }
+        # Calculate contribution percentage
+        contribution_pct = (weight / total_weight) * 100 if total_weight > 0 else 0
 
-    /* Section Headers */
-    .section-header {
-        display: flex;
-        align-items: center;
-        gap: 12px;
-        margin-bottom: 16px;
-        padding-bottom: 12px;
-        border-bottom: 2px solid #f0f0f0;
-    }
+        # Severity assessment
+        sev_info = _SEVERITY_INFO.get(severity, _SEVERITY_INFO['medium'])
 
-    .section-header h2 {
-        margin: 0 !important;
-        font-size: 1.5rem !important;
-        font-weight: 600;
-        color: #1a202c;
-    }
+        # Impact explanation
+        if weight >= 30:
+            impact_level = "DOMINANT FACTOR"
+            impact_note = f"This rule alone accounts for {contribution_pct:.0f}% of the risk score"
+        elif weight >= 20:
+            impact_level = "MAJOR CONTRIBUTOR"
+            impact_note = f"Significant {contribution_pct:.0f}% contribution to total risk"
+        elif weight >= 10:
+            impact_level = "MODERATE IMPACT"
+            impact_note = f"Notable {contribution_pct:.0f}% of the risk assessment"
+        else:
+            impact_level = "SUPPORTING EVIDENCE"
+            impact_note = f"Adds {contribution_pct:.0f}% to overall risk picture"
 
-    .section-badge {
-        display: inline-block;
-        padding: 4px 12px;
-        background: linear-gradient(135deg, #667eea, #764ba2);
-        color: white;
-        border-radius: 20px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
+        hover_text = (
+            f"<b style='font-size:14px'>{rule_name}</b><br><br>"
+            f"<b style='color:{sev_info['color']}'>{sev_info['badge']} SEVERITY</b><br>"
+            f"{sev_info['impact']}<br><br>"
+            f"<b>📊 Risk Contribution:</b><br>"
+            f"• Risk Points: <b>+{weight}</b><br>"
+            f"• Percentage of Total: <b>{contribution_pct:.1f}%</b><br>"
+            f"• Impact Level: <b>{impact_level}</b><br><br>"
+            f"<b>🔍 Detection Detail:</b><br>"
+            f"{detail}<br><br>"
+            f"<b>💡 What This Means:</b><br>"
+            f"{impact_note}<br><br>"
+            f"<b>🎯 Analysis Impact:</b><br>"
+            f"{sev_info['action']}<br><br>"
+            f"<b>📈 Cumulative Effect:</b><br>"
+            f"Without this rule, score would be <b>{scenario['risk_score'] - weight}</b> instead of <b>{scenario['risk_score']}</b>"
+        )
+        rule_hover_texts.append(hover_text)
 
-    /* Subsection Headers */
-    .subsection-header {
-        display: flex;
-        align-items: center;
-        gap: 8px;
-        margin-bottom: 12px;
-    }
+    return names, weights, colors, rule_hover_texts, total_weight, critical_count
+
+
+def _build_amount_stats(scenario_key):
+    """Baseline statistics and hover text for the amount timeline of a scenario"""
+    viz_data = fraud_scenarios[scenario_key]['visualization_data']
+    amounts = viz_data['amounts']
+    dates = viz_data['dates']
+    baseline = np.asarray(amounts[:-1], dtype=np.float64)
+    avg = float(baseline.mean())
+    std = float(baseline.std())
+
+    # Enhanced hover for normal transactions
+    normal_hover_texts = []
+    for date, amount in zip(dates[:-1], amounts[:-1]):
+        deviation_pct = ((amount - avg) / avg * 100) if avg > 0 else 0
+
+        if abs(deviation_pct) < 20:
+            status = "🟢 Normal"
+            assessment = "Within expected range"
+        elif abs(deviation_pct) < 50:
+            status = "🟡 Slight Variation"
+            assessment = "Minor deviation from average"
+        else:
+            status = "🟠 Notable"
+            assessment = "Larger than typical but not alarming"
 
-    .subsection-header h3 {
-        margin: 0 !important;
-        font-size: 1.1rem !important;
-        font-weight: 600;
-        color: #2d3748;
-    }
+        hover_text = (
+            f"<b>Date:</b> {date}<br>"
+            f"<b>Amount:</b> ${amount}<br><br>"
+            f"<b>Status:</b> {status}<br>"
+            f"<b>vs Average:</b> ${avg:.0f}<br>"
+            f"<b>Deviation:</b> {deviation_pct:+.1f}%<br><br>"
+            f"<b>💡 Assessment:</b> {assessment}"
+        )
+        normal_hover_texts.append(hover_text)
+
+    # Enhanced hover for flagged transaction
+    flagged_amount = amounts[-1]
+    flagged_date = dates[-1]
+    increase_pct = ((flagged_amount - avg) / avg * 100) if avg > 0 else 0
+    std_deviations = (flagged_amount - avg) / std if std else 0.0
+
+    flagged_hover = (
+        f"<b style='font-size:14px; color:#dc2626'>🚨 FLAGGED TRANSACTION</b><br><br>"
+        f"<b>Date:</b> {flagged_date}<br>"
+        f"<b>Amount:</b> <b style='color:#dc2626'>${flagged_amount:,}</b><br><br>"
+        f"<b>📊 Anomaly Metrics:</b><br>"
+        f"• Average Transaction: <b>${avg:.0f}</b><br>"
+        f"• This Transaction: <b>${flagged_amount:,}</b><br>"
+        f"• Increase: <b>+{increase_pct:.0f}%</b><br>"
+        f"• Standard Deviations: <b>{std_deviations:.1f}σ</b><br><br>"
+        f"<b>🔴 Why This Was Flagged:</b><br>"
+        f"This transaction is <b>{flagged_amount/avg:.1f}x</b> larger than normal<br>"
+        f"activity, representing a <b>{increase_pct:.0f}%</b> spike that is<br>"
+        f"<b>{std_deviations:.0f}</b> standard deviations from typical behavior.<br><br>"
+        f"<b>🎯 Risk Assessment:</b><br>"
+        f"Extreme deviation from established spending pattern.<br>"
+        f"This level of anomaly warrants immediate investigation.<br><br>"
+        f"<b>💡 Context:</b><br>"
+        f"Sudden large transfers from dormant or low-activity<br>"
+        f"accounts are classic indicators of account takeover."
+    )
 
-    /* Compact Spacing */
-    .stMarkdown {
-        margin-bottom: 0.3rem;
-    }
+    return avg, std, normal_hover_texts, flagged_hover
 
-    h2 {
-        margin-top: 0.8rem !important;
-        margin-bottom: 0.4rem !important;
-    }
 
-    h3 {
-        margin-top: 0.4rem !important;
-        margin-bottom: 0.4rem !important;
-    }
+def _build_test_hovers(scenario_key):
+    """Hover text for each bar of the testing-pattern chart of a scenario"""
+    viz_data = fraud_scenarios[scenario_key]['visualization_data']
 
-    /* Dataframe Styling */
-    .stDataFrame {
-        margin-bottom: 0.5rem;
-        border-radius: 8px;
-        overflow: hidden;
-    }
+    # Enhanced hover for testing pattern
+    test_hover_texts = []
+    for idx, (time, amount, tx_type) in enumerate(zip(viz_data['times'], viz_data['amounts'], viz_data['types'])):
+        if tx_type == 'test':
+            status = "🟡 TEST TRANSACTION"
+            status_color = "#f59e0b"
+            insight = "Small transaction testing system limits"
+            action = "Fraudster validating stolen credentials"
+        else:
+            status = "🔴 EXPLOITATION"
+            status_color = "#ef4444"
+            insight = "Large fraudulent transaction after successful test"
+            action = "Actual fraud execution - stolen funds"
 
-    /* Chart Containers */
-    .js-plotly-plot {
-        margin-bottom: 0 !important;
-        border-radius: 8px;
-    }
+        hover_text = (
+            f"<b style='font-size:14px'>{time}</b><br><br>"
+            f"<b style='color:{status_color}'>{status}</b><br><br>"
+            f"<b>📊 Transaction Details:</b><br>"
+            f"• Amount: <b>${amount}</b><br>"
+            f"• Type: <b>{tx_type.upper()}</b><br>"
+            f"• Sequence: <b>#{idx+1}</b> of {len(viz_data['times'])}<br><br>"
+            f"<b>💡 Fraud Pattern:</b><br>"
+            f"{insight}<br><br>"
+            f"<b>🎯 Assessment:</b><br>"
+            f"{action}"
+        )
+        test_hover_texts.append(hover_text)
 
-    /* Metrics Enhancement */
-    [data-testid="stMetricValue"] {
-        font-size: 1.8rem;
-        font-weight: 700;
-        background: linear-gradient(135deg, #667eea, #764ba2);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }
+    return test_hover_texts
 
-    [data-testid="stMetricDelta"] {
-        font-size: 0.9rem;
-    }
 
-    [data-testid="stMetricLabel"] {
-        font-size: 0.85rem;
-        font-weight: 600;
-        color: #718096;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
+def _build_flow_summary(scenario_key):
+    """Incoming/outgoing totals and retention for a money-flow scenario"""
+    flow = fraud_scenarios[scenario_key]['visualization_data']['flow']
+    total_incoming = sum(flow['incoming'])
+    total_outgoing = sum(flow['outgoing'])
+    retention = total_incoming - total_outgoing
+    retention_pct = retention / total_incoming * 100
+    return total_incoming, total_outgoing, retention, retention_pct
 
-    /* Column Gap Reduction */
-    [data-testid="column"] {
-        padding: 0 0.4rem;
-    }
 
-    /* Professional Button Styling */
-    .stButton > button {
-        border-radius: 8px;
-        font-weight: 600;
-        transition: all 0.2s ease;
-        border: 2px solid transparent;
-    }
+def _build_flow_html(scenario_key):
+    """Incoming and outgoing money-flow columns as a single HTML grid"""
+    flow = fraud_scenarios[scenario_key]['visualization_data']['flow']
+    total_incoming, total_outgoing, retention, retention_pct = _build_flow_summary(scenario_key)
 
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
-        border-color: #667eea;
-    }
+    incoming_lines = "".join(
+        f"• {escape(source)}: ${amount}<br>" for source, amount in zip(flow['sources'], flow['incoming'])
+    )
+    return (
+        "<div class='metric-grid flow-grid'>"
+        f"<div><b>📥 Incoming</b><br>{incoming_lines}<b>Total Incoming:</b> ${total_incoming}</div>"
+        f"<div><b>📤 Outgoing</b><br>• {escape(flow['destination'])}: ${flow['outgoing'][0]}<br>"
+        f"<b>Total Outgoing:</b> ${total_outgoing}<br>"
+        f"<b>Retained:</b> ${retention} ({retention_pct:.1f}%)</div>"
+        "</div>"
+    )
 
-    /* Caption Styling */
-    .stCaptionContainer {
-        margin-top: 8px;
-    }
 
-    /* Info Box Styling */
-    .stAlert {
-        border-radius: 8px;
-        border-left-width: 4px;
-    }
+def _build_chain_markdown(scenario_key):
+    """Refund chain hops as a single markdown block"""
+    chain = fraud_scenarios[scenario_key]['visualization_data']['chain']
+    # Dollar signs are escaped so hops in one block don't pair up as math
+    return "\n\n".join(
+        f"{'📥' if hop['type'] == 'payment' else '📤'} {hop['from']} → {hop['to']}: "
+        f"**\\${hop['amount']}** ({hop['type']})"
+        for hop in chain
+    )
 
-    /* Divider Styling */
-    hr {
-        margin: 2rem 0;
-        border: none;
-        height: 2px;
-        background: linear-gradient(to right, transparent, #e2e8f0, transparent);
-    }
 
-    /* Gradient Text */
-    .gradient-text {
-        background: linear-gradient(135deg, #667eea, #764ba2);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        font-weight: 700;
-    }
+def _precompute(scenario_key):
+    """Static chart data and HTML derived from a scenario"""
+    names, weights, colors, hover_texts, total_weight, critical_count = _build_rule_frame(scenario_key)
 
-    /* Expander Styling */
-    .streamlit-expanderHeader {
-        border-radius: 8px;
-        font-weight: 600;
+    meta = {
+        'rule_names': names,
+        'rule_weights': weights,
+        'rule_colors': colors,
+        'rule_hover_texts': hover_texts,
+        'total_weight': total_weight,
+        'critical_rules': critical_count,
+        'timeline_html': _build_timeline_html(scenario_key),
+        'metrics_html': _build_metrics_html(scenario_key),
     }
-    </style>
-    """, unsafe_allow_html=True)
+    return meta
+
+
+# Derived scenario data, computed once at import
+_SCENARIO_META = {key: _precompute(key) for key in fraud_scenarios}
+
+
+@st.cache_data(show_spinner=False)
+def _build_viz_meta(scenario_key):
+    """Statistics and hover text for the advanced visualizations of a scenario"""
+    viz_data = fraud_scenarios[scenario_key]['visualization_data']
+
+    viz_meta = {}
+    if 'amounts' in viz_data and 'dates' in viz_data:
+        viz_meta['amount_stats'] = _build_amount_stats(scenario_key)
+    if 'times' in viz_data and 'types' in viz_data:
+        viz_meta['test_hovers'] = _build_test_hovers(scenario_key)
+        viz_meta['test_log_amounts'] = np.log10(np.asarray(viz_data['amounts'], dtype=np.float64)).tolist()
+    if 'flow' in viz_data:
+        viz_meta['flow_html'] = _build_flow_html(scenario_key)
+    if 'chain' in viz_data:
+        viz_meta['chain_markdown'] = _build_chain_markdown(scenario_key)
+    return viz_meta
+
+
+@st.cache_resource
+def _ai_engine():
+    """AI recommendation engine shared across reruns and sessions"""
+    return get_ai_engine()
+
+
+@st.cache_resource(show_spinner=False)
+def _build_confidence_gauge(scenario_key):
+    """Analyst confidence gauge for a scenario"""
+    scenario = fraud_scenarios[scenario_key]
+
+    fig_conf = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=scenario['decision']['confidence'],
+        domain={'x': [0, 1], 'y': [0, 1]},
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': {'color': "#10b981" if scenario['decision']['confidence'] >= 90 else "#f97316"},
+            'steps': [
+                {'range': [0, 60], 'color': "#fee2e2"},
+                {'range': [60, 80], 'color': "#fef3c7"},
+                {'range': [80, 100], 'color': "#d1fae5"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
 
-    # Professional Header with Gradient
-    st.markdown("""
-    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 12px; margin-bottom: 24px; box-shadow: 0 4px 16px rgba(102, 126, 234, 0.3);'>
-        <h1 style='color: white; margin: 0; font-size: 2rem; font-weight: 700; text-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
-            🎯 Attack Pattern Simulator
-        </h1>
-        <p style='color: rgba(255,255,255,0.95); margin: 8px 0 0 0; font-size: 1.1rem; font-weight: 500;'>
-            Comprehensive Analysis of 13 Fraud Detection Scenarios
-        </p>
-        <div style='display: inline-flex; align-items: center; gap: 6px; margin-top: 12px; padding: 6px 14px; background: rgba(255,255,255,0.2); border-radius: 20px; backdrop-filter: blur(10px);'>
-            <div style='width: 8px; height: 8px; background: #10b981; border-radius: 50%; animation: pulse 2s infinite;'></div>
-            <span style='color: white; font-size: 0.85rem; font-weight: 600;'>SYSTEM ACTIVE</span>
-        </div>
-    </div>
+    fig_conf.update_layout(height=200, margin=dict(l=20, r=20, t=20, b=20))
+    return fig_conf
 
-    <style>
-    @keyframes pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.5; }
-    }
-    </style>
-    """, unsafe_allow_html=True)
 
-    # Get standardized chart colors
-    colors = get_chart_colors()
+@st.cache_resource(show_spinner=False)
+def _build_rules_figure(scenario_key):
+    """Rule weight contribution bar chart for a scenario"""
+    meta = _SCENARIO_META[scenario_key]
 
-    # ==================== SECTION 1: Scenario Selector ====================
-    st.markdown("""
-    <div class='section-header'>
-        <h2>🔽 Scenario Selector</h2>
-        <span class='section-badge'>INTERACTIVE</span>
-    </div>
-    """, unsafe_allow_html=True)
+    fig_rules = go.Figure()
+    fig_rules.add_trace(go.Bar(
+        y=meta['rule_names'],
+        x=meta['rule_weights'],
+        orientation='h',
+        marker=dict(
+            color=meta['rule_colors'],
+            line=dict(color='white', width=1)
+        ),
+        text=meta['rule_weights'],
+        textposition='outside',
+        hovertemplate='%{customdata}<extra></extra>',
+        customdata=meta['rule_hover_texts']
+    ))
 
-    scenario_key_top = st.selectbox(
-        "Select a fraud scenario to analyze:",
-        options=list(fraud_scenarios.keys()),
-        format_func=lambda x: fraud_scenarios[x]['title'],
-        key="scenario_key_top",
+    fig_rules.update_layout(
+        title="Rule Weight Contribution to Risk Score",
+        xaxis_title="Risk Points Added",
+        yaxis_title="",
+        height=400,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(size=12),
+        margin=dict(l=20, r=20, t=40, b=20)
+    )
+    return fig_rules
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _scenario_insight(scenario_key):
+    """AI pattern insight for a scenario"""
+    scenario = fraud_scenarios[scenario_key]
+    return _ai_engine().get_pattern_insight(
+        pattern_type="fraud_scenario",
+        pattern_data={
+            "scenario_type": scenario['title'],
+            "risk_score": scenario['risk_score'],
+            "outcome": scenario['outcome'],
+            "rules_triggered": len(scenario['triggered_rules']),
+            "confidence": scenario['decision']['confidence']
+        }
     )
 
-    # Sidebar for scenario selection
-    with st.sidebar:
-        st.markdown("### 🔍 Select Fraud Scenario")
 
-        scenario_key = st.selectbox(
-            "Choose a scenario to analyze:",
-            options=list(fraud_scenarios.keys()),
-            format_func=lambda x: fraud_scenarios[x]['title']
-        )
+@st.cache_data(ttl=60, show_spinner=False)
+def _footer_ts():
+    """Footer timestamp, refreshed at most once a minute"""
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        st.markdown("---")
-        st.markdown("### 📊 Display Options")
+
+@st.fragment
+def _render_scenario_body(active_scenario_key):
+    """Render the scenario sections; display toggles rerun only this fragment"""
+    scenario = fraud_scenarios[active_scenario_key]
+    meta = _SCENARIO_META[active_scenario_key]
+
+    # Display options
+    opt_col1, opt_col2, opt_col3 = st.columns(3)
+    with opt_col1:
         show_visualizations = st.checkbox("Show Advanced Visualizations", value=True)
+    with opt_col2:
         show_metrics = st.checkbox("Show Detailed Metrics", value=True)
+    with opt_col3:
         show_timeline = st.checkbox("Show Timeline", value=True)
 
-    # Prefer the top dropdown selection if present; fall back to sidebar
-    active_scenario_key = st.session_state.get("scenario_key_top", None) or scenario_key
-    scenario = fraud_scenarios[active_scenario_key]
-
     # ==================== SECTION 2: Scenario Overview ====================
-    st.markdown("""
-    <div class='section-header' style='margin-top: 28px;'>
-        <h2>📋 Scenario Overview</h2>
-        <span class='section-badge'>ANALYSIS</span>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_SECTION_HEADER.format(icon="📋", title="Scenario Overview", badge="ANALYSIS"), unsafe_allow_html=True)
 
     # Scenario title card
     st.markdown(f"""
@@ -821,12 +982,7 @@ def render():
         st.metric("Outcome", scenario['outcome'])
 
     # ==================== SECTION 3: Analyst Decision ====================
-    st.markdown("""
-    <div class='section-header' style='margin-top: 28px;'>
-        <h2>🎯 Analyst Decision & Recommendation</h2>
-        <span class='section-badge'>DECISION</span>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_SECTION_HEADER.format(icon="🎯", title="Analyst Decision & Recommendation", badge="DECISION"), unsafe_allow_html=True)
 
     decision_col1, decision_col2 = st.columns([2, 1])
 
@@ -835,28 +991,8 @@ def render():
         st.markdown(f"**Confidence Level:** {scenario['decision']['confidence']}%")
         
         # Confidence bar
-        fig_conf = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=scenario['decision']['confidence'],
-            domain={'x': [0, 1], 'y': [0, 1]},
-            gauge={
-                'axis': {'range': [0, 100]},
-                'bar': {'color': "#10b981" if scenario['decision']['confidence'] >= 90 else "#f97316"},
-                'steps': [
-                    {'range': [0, 60], 'color': "#fee2e2"},
-                    {'range': [60, 80], 'color': "#fef3c7"},
-                    {'range': [80, 100], 'color': "#d1fae5"}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 90
-                }
-            }
-        ))
-        
-        fig_conf.update_layout(height=200, margin=dict(l=20, r=20, t=20, b=20))
-        st.plotly_chart(fig_conf, use_container_width=True)
+        fig_conf = _build_confidence_gauge(active_scenario_key)
+        st.plotly_chart(fig_conf, use_container_width=True, key="scenario_confidence_gauge")
         
         st.markdown(f"**Reasoning:** {scenario['decision']['reasoning']}")
         st.markdown(f"**Recommended Action:** {scenario['decision']['action']}")
@@ -865,168 +1001,29 @@ def render():
         st.markdown("---")
         st.markdown("#### 🤖 AI Analysis")
 
-        ai_engine = get_ai_engine()
-        scenario_insight = ai_engine.get_pattern_insight(
-            pattern_type="fraud_scenario",
-            pattern_data={
-                "scenario_type": scenario['title'],
-                "risk_score": scenario['risk_score'],
-                "outcome": scenario['outcome'],
-                "rules_triggered": len(scenario['triggered_rules']),
-                "confidence": scenario['decision']['confidence']
-            }
-        )
+        scenario_insight = _scenario_insight(active_scenario_key)
 
-        st.markdown(f"""
-        <div style='background: linear-gradient(135deg, #e3f2fd, #bbdefb); padding: 16px; border-radius: 10px; border-left: 5px solid #2196f3; margin-top: 16px;'>
-            <div style='color: #1565c0; font-size: 0.9rem; line-height: 1.6;'>
-                {scenario_insight}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_AI_INSIGHT_TEMPLATE.format(insight=scenario_insight), unsafe_allow_html=True)
 
     # Timeline Section
     if show_timeline:
-        st.markdown("""
-        <div class='section-header' style='margin-top: 28px;'>
-            <h2>⏱️ Detection Timeline</h2>
-            <span class='section-badge'>CHRONOLOGY</span>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        timeline_df = pd.DataFrame(scenario['timeline'])
+        st.markdown(_SECTION_HEADER.format(icon="⏱️", title="Detection Timeline", badge="CHRONOLOGY"), unsafe_allow_html=True)
         
-        for idx, row in timeline_df.iterrows():
-            status_class = {
-                'normal': '🟢', 'warning': '🟡', 'flagged': '🟠', 'critical': '🔴',
-                'blocked': '🟣', 'review': '🔵', 'resolved': '⚫', 'escalated': '🔴',
-                'reported': '🟠', 'monitoring': '🔵', 'logged': '⚫'
-            }.get(row['status'], '⚪')
-            
-            st.markdown(f"{status_class} **{row['time']}** - {row['event']}")
+        st.markdown(meta['timeline_html'], unsafe_allow_html=True)
 
     # ==================== SECTION 4: Triggered Rules ====================
-    st.markdown("""
-    <div class='section-header' style='margin-top: 28px;'>
-        <h2>🚨 Triggered Rules & Risk Contribution</h2>
-        <span class='section-badge'>DETECTION</span>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_SECTION_HEADER.format(icon="🚨", title="Triggered Rules & Risk Contribution", badge="DETECTION"), unsafe_allow_html=True)
 
     # Create rule contribution chart
-    rule_df = pd.DataFrame(scenario['triggered_rules'])
-    rule_df = rule_df.sort_values('weight', ascending=True)
-
-    # Enhanced hover texts with explainability
-    rule_hover_texts = []
-    total_weight = rule_df['weight'].sum()
-
-    for _, row in rule_df.iterrows():
-        rule_name = row['name']
-        weight = row['weight']
-        detail = row['detail']
-        severity = row['severity']
-
-        # Calculate contribution percentage
-        contribution_pct = (weight / total_weight) * 100 if total_weight > 0 else 0
-
-        # Severity assessment
-        severity_info = {
-            'critical': {
-                'badge': '🔴 CRITICAL',
-                'color': '#dc2626',
-                'impact': 'Major fraud indicator - Extremely suspicious behavior',
-                'action': 'This alone warrants investigation'
-            },
-            'high': {
-                'badge': '🟠 HIGH',
-                'color': '#f59e0b',
-                'impact': 'Strong fraud signal - Significant risk factor',
-                'action': 'Important contributor to overall risk'
-            },
-            'medium': {
-                'badge': '🟡 MODERATE',
-                'color': '#eab308',
-                'impact': 'Notable concern - Adds to risk profile',
-                'action': 'Supporting evidence for fraud detection'
-            },
-            'low': {
-                'badge': '🔵 LOW',
-                'color': '#3b82f6',
-                'impact': 'Minor flag - Supplementary indicator',
-                'action': 'Minimal contribution to risk score'
-            }
-        }
-
-        sev_info = severity_info.get(severity, severity_info['medium'])
-
-        # Impact explanation
-        if weight >= 30:
-            impact_level = "DOMINANT FACTOR"
-            impact_note = f"This rule alone accounts for {contribution_pct:.0f}% of the risk score"
-        elif weight >= 20:
-            impact_level = "MAJOR CONTRIBUTOR"
-            impact_note = f"Significant {contribution_pct:.0f}% contribution to total risk"
-        elif weight >= 10:
-            impact_level = "MODERATE IMPACT"
-            impact_note = f"Notable {contribution_pct:.0f}% of the risk assessment"
-        else:
-            impact_level = "SUPPORTING EVIDENCE"
-            impact_note = f"Adds {contribution_pct:.0f}% to overall risk picture"
-
-        hover_text = (
-            f"<b style='font-size:14px'>{rule_name}</b><br><br>"
-            f"<b style='color:{sev_info['color']}'>{sev_info['badge']} SEVERITY</b><br>"
-            f"{sev_info['impact']}<br><br>"
-            f"<b>📊 Risk Contribution:</b><br>"
-            f"• Risk Points: <b>+{weight}</b><br>"
-            f"• Percentage of Total: <b>{contribution_pct:.1f}%</b><br>"
-            f"• Impact Level: <b>{impact_level}</b><br><br>"
-            f"<b>🔍 Detection Detail:</b><br>"
-            f"{detail}<br><br>"
-            f"<b>💡 What This Means:</b><br>"
-            f"{impact_note}<br><br>"
-            f"<b>🎯 Analysis Impact:</b><br>"
-            f"{sev_info['action']}<br><br>"
-            f"<b>📈 Cumulative Effect:</b><br>"
-            f"Without this rule, score would be <b>{scenario['risk_score'] - weight}</b> instead of <b>{scenario['risk_score']}</b>"
-        )
-        rule_hover_texts.append(hover_text)
-
-    fig_rules = go.Figure()
-    fig_rules.add_trace(go.Bar(
-        y=rule_df['name'],
-        x=rule_df['weight'],
-        orientation='h',
-        marker=dict(
-            color=rule_df['severity'].map({
-                'critical': '#ef4444', 'high': '#f97316', 'medium': '#eab308', 'low': '#3b82f6'
-            }),
-            line=dict(color='white', width=1)
-        ),
-        text=rule_df['weight'],
-        textposition='outside',
-        hovertemplate='%{customdata}<extra></extra>',
-        customdata=rule_hover_texts
-    ))
-
-    fig_rules.update_layout(
-        title="Rule Weight Contribution to Risk Score",
-        xaxis_title="Risk Points Added",
-        yaxis_title="",
-        height=400,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(size=12),
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+    fig_rules = _build_rules_figure(active_scenario_key)
 
     chart_with_explanation(
         fig_rules,
         title="Rule Weight Contribution",
         what_it_shows="Horizontal bar chart showing how each triggered rule contributes to the total risk score, colored by severity level (critical=red, high=orange, medium=yellow).",
         why_it_matters="Explains exactly why a transaction was flagged and the relative importance of each rule. Essential for analyst decision-making and model transparency.",
-        what_to_do="Focus investigation on critical-severity rules first. Verify the underlying data for high-weight rules. Use this breakdown to explain decisions to customers."
+        what_to_do="Focus investigation on critical-severity rules first. Verify the underlying data for high-weight rules. Use this breakdown to explain decisions to customers.",
+        key="scenario_rule_contribution"
     )
 
     # Detailed rules table
@@ -1035,40 +1032,36 @@ def render():
         <h3>📋 Detailed Rule Analysis</h3>
     </div>
     """, unsafe_allow_html=True)
-    for idx, rule in enumerate(scenario['triggered_rules']):
-        severity_emoji = {
-            'critical': '🔴', 'high': '🟠', 'medium': '🟡', 'low': '🔵'
-        }.get(rule['severity'], '⚪')
-        
-        with st.expander(f"{severity_emoji} {rule['name']} (+{rule['weight']} points)"):
-            st.markdown(f"**Severity:** {rule['severity'].upper()}")
-            st.markdown(f"**Detail:** {rule['detail']}")
-            st.markdown(f"**Risk Contribution:** {rule['weight']} points")
+    rule_detail_df = pd.DataFrame(scenario['triggered_rules'])[['name', 'severity', 'weight', 'detail']]
+    rule_detail_df['severity'] = (
+        rule_detail_df['severity'].map(_SEVERITY_EMOJI).fillna('⚪')
+        + ' ' + rule_detail_df['severity'].str.upper()
+    )
+
+    st.dataframe(
+        rule_detail_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'name': st.column_config.TextColumn("Rule"),
+            'severity': st.column_config.TextColumn("Severity"),
+            'weight': st.column_config.NumberColumn("Risk Contribution", format="+%d points"),
+            'detail': st.column_config.TextColumn("Detail", width="large")
+        }
+    )
 
     # Metrics Section
     if show_metrics:
-        st.markdown("""
-        <div class='section-header' style='margin-top: 28px;'>
-            <h2>📈 Key Detection Metrics</h2>
-            <span class='section-badge'>METRICS</span>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_SECTION_HEADER.format(icon="📈", title="Key Detection Metrics", badge="METRICS"), unsafe_allow_html=True)
         
-        metrics_cols = st.columns(len(scenario['metrics']))
-        for idx, (key, value) in enumerate(scenario['metrics'].items()):
-            with metrics_cols[idx]:
-                st.metric(key, value)
+        st.markdown(meta['metrics_html'], unsafe_allow_html=True)
 
     # Advanced Visualizations
     if show_visualizations and 'visualization_data' in scenario:
-        st.markdown("""
-        <div class='section-header' style='margin-top: 28px;'>
-            <h2>📊 Advanced Analysis Visualizations</h2>
-            <span class='section-badge'>VISUAL ANALYTICS</span>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_SECTION_HEADER.format(icon="📊", title="Advanced Analysis Visualizations", badge="VISUAL ANALYTICS"), unsafe_allow_html=True)
         
         viz_data = scenario['visualization_data']
+        viz_meta = _build_viz_meta(active_scenario_key)
         
         # Scenario 1: Transaction Amount Timeline
         if 'amounts' in viz_data and 'dates' in viz_data:
@@ -1076,32 +1069,7 @@ def render():
 
             amounts = viz_data['amounts']
             dates = viz_data['dates']
-            avg = sum(amounts[:-1]) / len(amounts[:-1])
-
-            # Enhanced hover for normal transactions
-            normal_hover_texts = []
-            for date, amount in zip(dates[:-1], amounts[:-1]):
-                deviation_pct = ((amount - avg) / avg * 100) if avg > 0 else 0
-
-                if abs(deviation_pct) < 20:
-                    status = "🟢 Normal"
-                    assessment = "Within expected range"
-                elif abs(deviation_pct) < 50:
-                    status = "🟡 Slight Variation"
-                    assessment = "Minor deviation from average"
-                else:
-                    status = "🟠 Notable"
-                    assessment = "Larger than typical but not alarming"
-
-                hover_text = (
-                    f"<b>Date:</b> {date}<br>"
-                    f"<b>Amount:</b> ${amount}<br><br>"
-                    f"<b>Status:</b> {status}<br>"
-                    f"<b>vs Average:</b> ${avg:.0f}<br>"
-                    f"<b>Deviation:</b> {deviation_pct:+.1f}%<br><br>"
-                    f"<b>💡 Assessment:</b> {assessment}"
-                )
-                normal_hover_texts.append(hover_text)
+            avg, std, normal_hover_texts, flagged_hover = viz_meta['amount_stats']
 
             # Normal transactions
             fig_amount.add_trace(go.Scatter(
@@ -1115,33 +1083,6 @@ def render():
                 customdata=normal_hover_texts
             ))
 
-            # Enhanced hover for flagged transaction
-            flagged_amount = amounts[-1]
-            flagged_date = dates[-1]
-            increase_pct = ((flagged_amount - avg) / avg * 100) if avg > 0 else 0
-            std_deviations = (flagged_amount - avg) / (sum([(x-avg)**2 for x in amounts[:-1]]) / len(amounts[:-1]))**0.5
-
-            flagged_hover = (
-                f"<b style='font-size:14px; color:#dc2626'>🚨 FLAGGED TRANSACTION</b><br><br>"
-                f"<b>Date:</b> {flagged_date}<br>"
-                f"<b>Amount:</b> <b style='color:#dc2626'>${flagged_amount:,}</b><br><br>"
-                f"<b>📊 Anomaly Metrics:</b><br>"
-                f"• Average Transaction: <b>${avg:.0f}</b><br>"
-                f"• This Transaction: <b>${flagged_amount:,}</b><br>"
-                f"• Increase: <b>+{increase_pct:.0f}%</b><br>"
-                f"• Standard Deviations: <b>{std_deviations:.1f}σ</b><br><br>"
-                f"<b>🔴 Why This Was Flagged:</b><br>"
-                f"This transaction is <b>{flagged_amount/avg:.1f}x</b> larger than normal<br>"
-                f"activity, representing a <b>{increase_pct:.0f}%</b> spike that is<br>"
-                f"<b>{std_deviations:.0f}</b> standard deviations from typical behavior.<br><br>"
-                f"<b>🎯 Risk Assessment:</b><br>"
-                f"Extreme deviation from established spending pattern.<br>"
-                f"This level of anomaly warrants immediate investigation.<br><br>"
-                f"<b>💡 Context:</b><br>"
-                f"Sudden large transfers from dormant or low-activity<br>"
-                f"accounts are classic indicators of account takeover."
-            )
-
             # Flagged transaction
             fig_amount.add_trace(go.Scatter(
                 x=[dates[-1]],
@@ -1170,7 +1111,8 @@ def render():
                 title="Transaction Amount Over Time",
                 what_it_shows="Time series of transaction amounts leading up to the flagged transaction, with the suspicious transaction highlighted as a red star against the normal pattern.",
                 why_it_matters="Visualizes the deviation from normal behavior. Extreme spikes in amount are classic fraud indicators showing sudden draining attempts.",
-                what_to_do="Calculate the standard deviation of the spike. Verify if customer authorized the large transaction. Check for other accounts with similar patterns."
+                what_to_do="Calculate the standard deviation of the spike. Verify if customer authorized the large transaction. Check for other accounts with similar patterns.",
+                key="scenario_amount_timeline"
             )
         
         # Scenario 2: Testing Pattern
@@ -1179,37 +1121,12 @@ def render():
 
             colors = ['#fbbf24' if t == 'test' else '#ef4444' for t in viz_data['types']]
 
-            # Enhanced hover for testing pattern
-            test_hover_texts = []
-            for idx, (time, amount, tx_type) in enumerate(zip(viz_data['times'], viz_data['amounts'], viz_data['types'])):
-                if tx_type == 'test':
-                    status = "🟡 TEST TRANSACTION"
-                    status_color = "#f59e0b"
-                    insight = "Small transaction testing system limits"
-                    action = "Fraudster validating stolen credentials"
-                else:
-                    status = "🔴 EXPLOITATION"
-                    status_color = "#ef4444"
-                    insight = "Large fraudulent transaction after successful test"
-                    action = "Actual fraud execution - stolen funds"
-
-                hover_text = (
-                    f"<b style='font-size:14px'>{time}</b><br><br>"
-                    f"<b style='color:{status_color}'>{status}</b><br><br>"
-                    f"<b>📊 Transaction Details:</b><br>"
-                    f"• Amount: <b>${amount}</b><br>"
-                    f"• Type: <b>{tx_type.upper()}</b><br>"
-                    f"• Sequence: <b>#{idx+1}</b> of {len(viz_data['times'])}<br><br>"
-                    f"<b>💡 Fraud Pattern:</b><br>"
-                    f"{insight}<br><br>"
-                    f"<b>🎯 Assessment:</b><br>"
-                    f"{action}"
-                )
-                test_hover_texts.append(hover_text)
+            test_hover_texts = viz_meta['test_hovers']
 
             fig_test.add_trace(go.Bar(
                 x=viz_data['times'],
-                y=viz_data['amounts'],
+                y=[v - _LOG_AXIS_FLOOR for v in viz_meta['test_log_amounts']],
+                base=_LOG_AXIS_FLOOR,
                 marker=dict(color=colors),
                 text=[f"${a}" for a in viz_data['amounts']],
                 textposition='outside',
@@ -1221,7 +1138,7 @@ def render():
                 title="Testing Pattern: Small Tests → Large Exploitation",
                 xaxis_title="Time",
                 yaxis_title="Amount ($)",
-                yaxis_type="log",
+                yaxis=dict(**_LOG_AXIS_TICKS),
                 height=400
             )
 
@@ -1230,7 +1147,8 @@ def render():
                 title="Testing Pattern Analysis",
                 what_it_shows="Bar chart showing the classic testing pattern: small test transactions (yellow) followed by a large exploitation attempt (red), displayed on a log scale.",
                 why_it_matters="Testing patterns are a hallmark of automated fraud attacks. Fraudsters validate stolen credentials with small amounts before attempting large theft.",
-                what_to_do="Block the exploitation attempt immediately. Review and potentially freeze the account. Check for similar patterns across other accounts."
+                what_to_do="Block the exploitation attempt immediately. Review and potentially freeze the account. Check for similar patterns across other accounts.",
+                key="scenario_testing_pattern"
             )
 
         # Scenario 4: Money Mule Flow
@@ -1241,21 +1159,7 @@ def render():
             </div>
             """, unsafe_allow_html=True)
             
-            flow = viz_data['flow']
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown("**📥 Incoming**")
-                for idx, (source, amount) in enumerate(zip(flow['sources'], flow['incoming'])):
-                    st.markdown(f"• {source}: ${amount}")
-                st.markdown(f"**Total Incoming:** ${sum(flow['incoming'])}")
-            
-            with col2:
-                st.markdown("**📤 Outgoing**")
-                st.markdown(f"• {flow['destination']}: ${flow['outgoing'][0]}")
-                st.markdown(f"**Total Outgoing:** ${sum(flow['outgoing'])}")
-                retention = sum(flow['incoming']) - sum(flow['outgoing'])
-                st.markdown(f"**Retained:** ${retention} ({retention/sum(flow['incoming'])*100:.1f}%)")
+            st.markdown(viz_meta['flow_html'], unsafe_allow_html=True)
 
         # Scenario 5: Device Comparison
         if 'device_comparison' in viz_data:
@@ -1290,12 +1194,8 @@ def render():
                 <h3>🔗 Transaction Chain Visualization</h3>
             </div>
             """, unsafe_allow_html=True)
-            
-            chain_df = pd.DataFrame(viz_data['chain'])
-            
-            for idx, row in chain_df.iterrows():
-                emoji = "📥" if row['type'] == 'payment' else "📤"
-                st.markdown(f"{emoji} {row['from']} → {row['to']}: **${row['amount']}** ({row['type']})")
+
+            st.markdown(viz_meta['chain_markdown'])
 
     # Decision Section
     with decision_col2:
@@ -1318,26 +1218,304 @@ def render():
             st.info("Verification call initiated")
 
     # ==================== SECTION 5: Summary Statistics ====================
-    st.markdown("""
-    <div class='section-header' style='margin-top: 28px;'>
-        <h2>📊 Scenario Summary Statistics</h2>
-        <span class='section-badge'>SUMMARY</span>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_SECTION_HEADER.format(icon="📊", title="Scenario Summary Statistics", badge="SUMMARY"), unsafe_allow_html=True)
 
     summary_col1, summary_col2, summary_col3, summary_col4 = st.columns(4, gap="medium")
 
     with summary_col1:
         st.metric("Total Rules Triggered", len(scenario['triggered_rules']))
     with summary_col2:
-        critical_rules = sum(1 for r in scenario['triggered_rules'] if r['severity'] == 'critical')
-        st.metric("Critical Rules", critical_rules)
+        st.metric("Critical Rules", meta['critical_rules'])
     with summary_col3:
-        total_weight = sum(r['weight'] for r in scenario['triggered_rules'])
-        st.metric("Total Risk Weight", total_weight)
+        st.metric("Total Risk Weight", meta['total_weight'])
     with summary_col4:
         st.metric("Detection Time", "Real-time" if scenario['risk_score'] >= 85 else "< 1 min")
 
+
+def render():
+    """Render the Fraud Scenario Analysis page"""
+
+    # Apply theme
+    apply_master_theme()
+    init_tooltip_toggle()
+
+    # Professional CSS for aesthetic design
+    st.markdown("""
+    <style>
+    /* Global Aesthetics */
+    .block-container {
+        padding-top: 0.5rem;
+        padding-bottom: 1rem;
+    }
+
+    /* Professional Card Styling */
+    .dashboard-card {
+        background: white;
+        border-radius: 12px;
+        padding: 20px;
+        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
+        margin-bottom: 20px;
+        border-left: 4px solid transparent;
+        transition: all 0.3s ease;
+    }
+
+    .dashboard-card:hover {
+        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.12);
+        transform: translateY(-2px);
+    }
+
+    .dashboard-card.critical {
+        border-left-color: #E54848;
+        background: linear-gradient(to right, #fff5f5 0%, white 10%);
+    }
+
+    .dashboard-card.success {
+        border-left-color: #2E865F;
+        background: linear-gradient(to right, #f0fdf4 0%, white 10%);
+    }
+
+    .dashboard-card.primary {
+        border-left-color: #667eea;
+        background: linear-gradient(to right, #f5f7ff 0%, white 10%);
+    }
+
+    .dashboard-card.warning {
+        border-left-color: #F3B65B;
+        background: linear-gradient(to right, #fffbf0 0%, white 10%);
+    }
+
+    /* Section Headers */
+    .section-header {
+        display: flex;
+        align-items: center;
+        gap: 12px;
+        margin-bottom: 16px;
+        padding-bottom: 12px;
+        border-bottom: 2px solid #f0f0f0;
+    }
+
+    .section-header h2 {
+        margin: 0 !important;
+        font-size: 1.5rem !important;
+        font-weight: 600;
+        color: #1a202c;
+    }
+
+    .section-badge {
+        display: inline-block;
+        padding: 4px 12px;
+        background: linear-gradient(135deg, #667eea, #764ba2);
+        color: white;
+        border-radius: 20px;
+        font-size: 0.75rem;
+        font-weight: 600;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
+
+    /* Subsection Headers */
+    .subsection-header {
+        display: flex;
+        align-items: center;
+        gap: 8px;
+        margin-bottom: 12px;
+    }
+
+    .subsection-header h3 {
+        margin: 0 !important;
+        font-size: 1.1rem !important;
+        font-weight: 600;
+        color: #2d3748;
+    }
+
+    /* Compact Spacing */
+    .stMarkdown {
+        margin-bottom: 0.3rem;
+    }
+
+    h2 {
+        margin-top: 0.8rem !important;
+        margin-bottom: 0.4rem !important;
+    }
+
+    h3 {
+        margin-top: 0.4rem !important;
+        margin-bottom: 0.4rem !important;
+    }
+
+    /* Dataframe Styling */
+    .stDataFrame {
+        margin-bottom: 0.5rem;
+        border-radius: 8px;
+        overflow: hidden;
+    }
+
+    /* Chart Containers */
+    .js-plotly-plot {
+        margin-bottom: 0 !important;
+        border-radius: 8px;
+    }
+
+    /* Metrics Enhancement */
+    [data-testid="stMetricValue"] {
+        font-size: 1.8rem;
+        font-weight: 700;
+        background: linear-gradient(135deg, #667eea, #764ba2);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+    }
+
+    [data-testid="stMetricDelta"] {
+        font-size: 0.9rem;
+    }
+
+    [data-testid="stMetricLabel"] {
+        font-size: 0.85rem;
+        font-weight: 600;
+        color: #718096;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
+
+    /* Metric Grid */
+    .metric-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
+        gap: 12px;
+    }
+
+    .flow-grid {
+        grid-template-columns: repeat(2, 1fr);
+        line-height: 1.8;
+    }
+
+    .metric-label {
+        font-size: 0.85rem;
+        font-weight: 600;
+        color: #718096;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
+
+    .metric-value {
+        font-size: 1.8rem;
+        font-weight: 700;
+        background: linear-gradient(135deg, #667eea, #764ba2);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+    }
+
+    /* Column Gap Reduction */
+    [data-testid="column"] {
+        padding: 0 0.4rem;
+    }
+
+    /* Professional Button Styling */
+    .stButton > button {
+        border-radius: 8px;
+        font-weight: 600;
+        transition: all 0.2s ease;
+        border: 2px solid transparent;
+    }
+
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
+        border-color: #667eea;
+    }
+
+    /* Caption Styling */
+    .stCaptionContainer {
+        margin-top: 8px;
+    }
+
+    /* Info Box Styling */
+    .stAlert {
+        border-radius: 8px;
+        border-left-width: 4px;
+    }
+
+    /* Divider Styling */
+    hr {
+        margin: 2rem 0;
+        border: none;
+        height: 2px;
+        background: linear-gradient(to right, transparent, #e2e8f0, transparent);
+    }
+
+    /* Gradient Text */
+    .gradient-text {
+        background: linear-gradient(135deg, #667eea, #764ba2);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+        font-weight: 700;
+    }
+
+    /* Timeline Styling */
+    .timeline-item {
+        padding: 4px 0;
+        line-height: 1.6;
+    }
+
+    /* Expander Styling */
+    .streamlit-expanderHeader {
+        border-radius: 8px;
+        font-weight: 600;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # Professional Header with Gradient
+    st.markdown("""
+    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 12px; margin-bottom: 24px; box-shadow: 0 4px 16px rgba(102, 126, 234, 0.3);'>
+        <h1 style='color: white; margin: 0; font-size: 2rem; font-weight: 700; text-shadow: 0 2px 4px rgba(0,0,0,0.1);'>
+            🎯 Attack Pattern Simulator
+        </h1>
+        <p style='color: rgba(255,255,255,0.95); margin: 8px 0 0 0; font-size: 1.1rem; font-weight: 500;'>
+            Comprehensive Analysis of 13 Fraud Detection Scenarios
+        </p>
+        <div style='display: inline-flex; align-items: center; gap: 6px; margin-top: 12px; padding: 6px 14px; background: rgba(255,255,255,0.2); border-radius: 20px; backdrop-filter: blur(10px);'>
+            <div style='width: 8px; height: 8px; background: #10b981; border-radius: 50%; animation: pulse 2s infinite;'></div>
+            <span style='color: white; font-size: 0.85rem; font-weight: 600;'>SYSTEM ACTIVE</span>
+        </div>
+    </div>
+
+    <style>
+    @keyframes pulse {
+        0%, 100% { opacity: 1; }
+        50% { opacity: 0.5; }
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # ==================== SECTION 1: Scenario Selector ====================
+    st.markdown("""
+    <div class='section-header'>
+        <h2>🔽 Scenario Selector</h2>
+        <span class='section-badge'>INTERACTIVE</span>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.selectbox(
+        "Select a fraud scenario to analyze:",
+        options=list(fraud_scenarios.keys()),
+        format_func=lambda x: fraud_scenarios[x]['title'],
+        key="active_scenario_key",
+    )
+    active_scenario_key = st.session_state["active_scenario_key"]
+    scenario = fraud_scenarios[active_scenario_key]
+
+    # Sidebar summary of the selected scenario
+    with st.sidebar:
+        st.markdown("### 🔍 Fraud Scenario")
+        st.markdown(f"**Current scenario:** {scenario['title']}")
+
+
+    _render_scenario_body(active_scenario_key)
+
     # ==================== FOOTER ====================
     st.markdown("<hr style='margin-top: 32px;'>", unsafe_allow_html=True)
 
@@ -1361,7 +1539,7 @@ def render():
             💡 All scenarios based on real fraud patterns and detection methodologies • © 2024 All rights reserved.
         </p>
     </div>
-    """.format(datetime.now().strftime('%Y-%m-%d %H:%M:%S')), unsafe_allow_html=True)
+    """.format(_footer_ts()), unsafe_allow_html=True)
 
 if __name__ == "__main__":
     render()